@@ -9,7 +9,7 @@ from neurosynth.base.dataset import download, Dataset
 import nimare
 from nimare.decode import discrete
 from nimare.meta.cbma.mkda import MKDAChi2
-from .utils import mutli_surface_to_volume
+from .utils import mutli_surface_to_volume, _read_surfaces
 
 
 def surface_decode_nimare(
@@ -67,6 +67,10 @@ def surface_decode_nimare(
 
     dataset = fetch_nimare_dataset(data_dir)
 
+    # Both volumes are built from the same surfaces; read them only once.
+    pial = _read_surfaces(pial)
+    white = _read_surfaces(white)
+
     with tempfile.NamedTemporaryFile(suffix=".nii.gz") as stat_image:
         with tempfile.NamedTemporaryFile(suffix=".nii.gz") as mask_image:
             mutli_surface_to_volume(
@@ -1,15 +1,23 @@
 """Utilities for handling label files"""
 
 import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import nibabel as nib
 import numpy as np
+import pandas as pd
 import tempfile
 import gzip
 import shutil
 from brainspace.mesh.mesh_io import read_surface
+from brainspace.mesh.mesh_creation import build_polydata
+from brainspace.mesh.mesh_elements import get_cells, get_points
 from brainspace.vtk_interface.wrappers.data_object import BSPolyData
 from brainstat.mesh.interpolate import surface_to_volume
 
+_SurfaceTriple = namedtuple("_SurfaceTriple", ["pial", "white", "labels"])
+
 
 def mutli_surface_to_volume(
     pial,
@@ -19,6 +27,7 @@ def mutli_surface_to_volume(
     output_file,
     interpolation="nearest",
     verbose=True,
+    n_jobs=1,
 ):
     """Interpolates multiple surfaces to the volume.
 
@@ -43,17 +52,73 @@ def mutli_surface_to_volume(
         for trilinear interpolation, defaults to 'nearest'.
     verbose : boolean
         If true, returns verbose output to console, defaults to true.
+    n_jobs : int
+        Maximum number of processes used to project the surfaces, defaults to
+        1 i.e. no parallel processing.
 
     Notes
     -----
     An equal number of pial/white surfaces and labels must be provided. If
     parcellations overlap across surfaces, then the labels are kept for the
     first provided surface.
+
+    With n_jobs > 1, worker processes are started. Under the 'spawn' start
+    method (the default on macOS and Windows) or 'forkserver' (the default on
+    Linux as of Python 3.14), scripts calling this function must then protect
+    their entry point with ``if __name__ == "__main__":``.
     """
 
-    # Deal with variety of ways to provide input.
-    if type(pial) is not type(white):
-        ValueError("Pial and white must be of the same type.")
+    surfaces = _normalize_surface_inputs(pial, white, labels)
+
+    if not isinstance(volume_template, nib.nifti1.Nifti1Image):
+        volume_template = nib.load(volume_template)
+
+    # Surface data to volume.
+    T = [tempfile.NamedTemporaryFile(suffix=".nii.gz") for _ in surfaces]
+    if n_jobs == 1 or len(surfaces) == 1:
+        for surface, tmp in zip(surfaces, T):
+            surface_to_volume(
+                surface.pial,
+                surface.white,
+                surface.labels,
+                volume_template,
+                tmp.name,
+                interpolation=interpolation,
+                verbose=verbose > 0,
+            )
+    else:
+        _parallel_surface_to_volume(
+            surfaces, volume_template, T, interpolation, verbose > 0, n_jobs
+        )
+
+    if len(T) > 1:
+        T_names = [x.name for x in T]
+        combine_parcellations(T_names, output_file)
+    else:
+        shutil.copy(T[0].name, output_file)
+
+
+def _normalize_surface_inputs(pial, white, labels):
+    """Loads the inputs of mutli_surface_to_volume into surface triples.
+
+    Parameters
+    ----------
+    pial : str, BSPolyData, list
+        Pial surface(s) as accepted by mutli_surface_to_volume.
+    white : str, BSPolyData, list
+        White matter surface(s) as accepted by mutli_surface_to_volume.
+    labels : str, numpy.ndarray, list
+        Label(s) as accepted by mutli_surface_to_volume.
+
+    Returns
+    -------
+    list
+        List of _SurfaceTriple, one for each provided surface.
+    """
+    if isinstance(pial, list) != isinstance(white, list):
+        raise ValueError(
+            "Pial and white must both be lists or both be single surfaces."
+        )
 
     if not isinstance(pial, list):
         pial = [pial]
@@ -62,42 +127,97 @@ def mutli_surface_to_volume(
     if not isinstance(labels, list):
         labels = [labels]
 
-    if len(pial) is not len(white):
-        ValueError("The same number of pial and white surfces must be provided.")
-
-    for i in range(len(pial)):
-        if not isinstance(pial[i], BSPolyData):
-            pial[i] = read_surface_gz(pial[i])
+    if not len(pial) == len(white) == len(labels):
+        raise ValueError(
+            "The same number of pial surfaces, white surfaces, and labels must "
+            "be provided."
+        )
 
-        if not isinstance(white[i], BSPolyData):
-            white[i] = read_surface_gz(white[i])
+    surfaces = []
+    for pial_i, white_i, labels_i in zip(pial, white, labels):
+        if not isinstance(labels_i, np.ndarray):
+            labels_i = load_mesh_labels(labels_i)
+        surfaces.append(
+            _SurfaceTriple(_read_surfaces(pial_i), _read_surfaces(white_i), labels_i)
+        )
+    return surfaces
 
-    if not isinstance(volume_template, nib.nifti1.Nifti1Image):
-        volume_template = nib.load(volume_template)
 
-    for i in range(len(labels)):
-        if not isinstance(labels[i], np.ndarray):
-            labels[i] = load_mesh_labels(labels[i])
+def _read_surfaces(surfaces):
+    """Reads surfaces that are provided as paths.
 
-    # Surface data to volume.
-    T = []
-    for i in range(len(pial)):
-        T.append(tempfile.NamedTemporaryFile(suffix=".nii.gz"))
-        surface_to_volume(
-            pial[i],
-            white[i],
-            labels[i],
-            volume_template,
-            T[i].name,
-            interpolation=interpolation,
-            verbose=verbose > 0,
-        )
+    Parameters
+    ----------
+    surfaces : str, BSPolyData, list
+        Path of a surface file, BSPolyData of a surface or a list containing
+        multiple of the aforementioned.
 
-    if len(T) > 1:
-        T_names = [x.name for x in T]
-        combine_parcellations(T_names, output_file)
+    Returns
+    -------
+    BSPolyData, list
+        The input with every path replaced by the loaded surface.
+    """
+    if isinstance(surfaces, list):
+        return [_read_surfaces(x) for x in surfaces]
+    elif isinstance(surfaces, BSPolyData):
+        return surfaces
     else:
-        shutil.copy(T[0].name, output_file)
+        return read_surface_gz(surfaces)
+
+
+def _parallel_surface_to_volume(
+    surfaces, volume_template, output_files, interpolation, verbose, n_jobs
+):
+    """Runs surface_to_volume for each surface in a pool of processes.
+
+    Parameters
+    ----------
+    surfaces : list
+        List of _SurfaceTriple.
+    volume_template : nibabel.nifti1.Nifti1Image
+        Template image passed to surface_to_volume.
+    output_files : list
+        Temporary files to which each surface's volume is written.
+    interpolation : str
+        Interpolation type passed to surface_to_volume.
+    verbose : bool
+        Verbosity passed to surface_to_volume.
+    n_jobs : int
+        Maximum number of worker processes.
+    """
+    # Meshes are sent as arrays as older VTK releases cannot pickle data
+    # objects.
+    with ProcessPoolExecutor(max_workers=min(n_jobs, len(surfaces))) as executor:
+        futures = [
+            executor.submit(
+                _surface_to_volume_worker,
+                (get_points(surface.pial), get_cells(surface.pial)),
+                (get_points(surface.white), get_cells(surface.white)),
+                surface.labels,
+                volume_template,
+                tmp.name,
+                interpolation,
+                verbose,
+            )
+            for surface, tmp in zip(surfaces, output_files)
+        ]
+        for future in futures:
+            future.result()
+
+
+def _surface_to_volume_worker(
+    pial, white, labels, volume_template, output_file, interpolation, verbose
+):
+    """Rebuilds the meshes from (points, cells) tuples and runs surface_to_volume."""
+    surface_to_volume(
+        build_polydata(*pial),
+        build_polydata(*white),
+        labels,
+        volume_template,
+        output_file,
+        interpolation=interpolation,
+        verbose=verbose,
+    )
 
 
 def combine_parcellations(files, output_file):
@@ -118,12 +238,15 @@ def combine_parcellations(files, output_file):
     """
     for i in range(len(files)):
         nii = nib.load(files[i])
-        if i is 0:
+        if i == 0:
             img = nii.get_fdata()
             affine = nii.affine
             header = nii.header
         else:
-            img[img == 0] = nii.get_fdata()[img == 0]
+            # Read the data in its stored type to avoid a float64 copy of
+            # every label image.
+            missing = img == 0
+            img[missing] = np.asarray(nii.dataobj)[missing]
     new_nii = nib.Nifti1Image(img, affine, header)
     nib.save(new_nii, output_file)
 
@@ -147,12 +270,14 @@ def load_mesh_labels(label_file, as_int=True):
     if label_file.endswith(".gii"):
         labels = nib.gifti.giftiio.read(label_file).agg_data()
     elif label_file.endswith(".csv"):
-        labels = np.loadtxt(label_file)
+        labels = pd.read_csv(label_file, header=None).to_numpy().ravel()
     else:
         ValueError("Unrecognized label file type.")
 
     if as_int:
-        labels = np.round(labels).astype(int)
+        if not np.issubdtype(labels.dtype, np.integer):
+            labels = np.round(labels)
+        labels = labels.astype(int, copy=False)
     return labels
 
 
@@ -173,7 +298,8 @@ def read_surface_gz(filename):
         extension = os.path.splitext(filename[:-3])[-1]
         with tempfile.NamedTemporaryFile(suffix=extension) as f_tmp:
             with gzip.open(filename, "rb") as f_gz:
-                shutil.copyfileobj(f_gz, f_tmp)
+                shutil.copyfileobj(f_gz, f_tmp, length=1 << 20)
+            f_tmp.flush()
             return read_surface(f_tmp.name)
     else:
         return read_surface(filename)
@@ -217,4 +343,23 @@ def load_enigma_histology(parcellation, n=None):
     csv_file = os.path.join(
         histology_dir, "bb_gradient_" + parcellation + num_parc + ".csv"
     )
-    return np.genfromtxt(csv_file, delimiter=",")
+    return _read_histology_csv(csv_file).copy()
+
+
+@lru_cache(maxsize=16)
+def _read_histology_csv(csv_file):
+    """Reads a histology gradient file.
+
+    Parameters
+    ----------
+    csv_file : str
+        Path to the .csv file.
+
+    Returns
+    -------
+    numpy.array
+        Contents of the file. Results are cached, so callers must not modify
+        the returned array in place.
+    """
+    data = pd.read_csv(csv_file, header=None).to_numpy(dtype=float)
+    return np.squeeze(data)
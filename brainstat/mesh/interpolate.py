@@ -5,7 +5,6 @@ from scipy.spatial import cKDTree
 from brainspace.mesh.mesh_io import read_surface
 from brainspace.vtk_interface.wrappers.data_object import BSPolyData
 from brainspace.mesh.mesh_elements import get_points, get_cells
-import trimesh
 
 
 def surface_to_volume(
@@ -70,10 +69,7 @@ def surface_to_volume(
     ribbon_points = np.rint(
         ribbon_points, np.ones(ribbon_points.shape, dtype=int), casting="unsafe"
     )
-    for i in range(ribbon_labels.shape[0]):
-        new_data[
-            ribbon_points[i, 0], ribbon_points[i, 1], ribbon_points[i, 2]
-        ] = ribbon_labels[i]
+    new_data[tuple(ribbon_points.T)] = ribbon_labels
 
     new_nii = nib.Nifti1Image(new_data, volume_template.affine)
     nib.save(new_nii, volume_save)
@@ -102,6 +98,8 @@ def cortical_ribbon(pial_mesh, wm_mesh, nii, mesh_distance=6, verbose=False):
         Matrix coordinates of voxels inside the cortical ribbon.
     """
 
+    import trimesh
+
     try:
         import pyembree
     except ImportError:
@@ -210,9 +208,9 @@ def ribbon_interpolation(
 
     ribbon_coord = nib.affines.apply_affine(nii.affine, points)
 
-    if interpolation is "nearest":
+    if interpolation == "nearest":
         interp = NearestNDInterpolator(mesh_coord, labels)
-    elif interpolation is "linear":
+    elif interpolation == "linear":
         interp = LinearNDInterpolator(mesh_coord, labels)
     else:
         ValueError("Unknown interpolation type.")
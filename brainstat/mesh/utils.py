@@ -6,7 +6,6 @@ from brainspace.mesh.mesh_creation import build_polydata
 from brainspace.mesh.mesh_elements import get_cells, get_points, get_edges
 from brainspace.vtk_interface.wrappers.data_object import BSPolyData
 import sys
-from ..stats.utils import colon
 
 
 def mesh_edges(surf, mask=None):
@@ -29,7 +28,7 @@ def mesh_edges(surf, mask=None):
     # This doesn't strictly test that its BrainStat SLM, but we can't import
     # directly without causing a circular import.
     class_name = surf.__class__.__name__
-    if class_name is "SLM":
+    if class_name == "SLM":
         if surf.tri is not None:
             surf = {"tri": surf.tri}
         elif surf.lat is not None:
@@ -46,18 +45,20 @@ def mesh_edges(surf, mask=None):
     # Convert triangles to edges by grabbing all unique edges within triangles.
     elif "tri" in surf:
         tri = np.sort(surf["tri"], axis=1)
-        edg = np.unique(
-            np.concatenate(
-                (np.concatenate((tri[:, [0, 1]], tri[:, [0, 2]])), tri[:, [1, 2]])
-            ),
-            axis=0,
-        )
-        edg = edg - 1
+        edg = np.vstack((tri[:, [0, 1]], tri[:, [0, 2]], tri[:, [1, 2]]))
+
+        # Pack each vertex pair into a single 64-bit key; a 1D unique is much
+        # faster than a row-wise unique and gives the same (sorted) ordering.
+        edg = edg.astype(np.uint64)
+        keys = np.unique((edg[:, 0] << np.uint64(32)) | edg[:, 1])
+        edg = np.column_stack((keys >> np.uint64(32), keys & np.uint64(0xFFFFFFFF)))
+        edg = edg.astype(tri.dtype) - 1
 
     elif "lat" in surf:
         # See the comments of SurfStatResels for a full explanation.
         if surf["lat"].ndim == 2:
             surf["lat"] = np.expand_dims(surf["lat"], axis=2)
+        lat_flat = surf["lat"].T.reshape(-1)
 
         I, J, K = np.shape(surf["lat"])
         IJ = I * J
@@ -85,73 +86,82 @@ def mesh_edges(surf, mask=None):
 
             # bottom slice
             edg0 = (
-                np.block(
-                    [
-                        [c1, c1, c1, c2 - 1, c2 - 1, c2, c11, c21 - I, c12, c22 - 1],
-                        [
-                            c1 + 1,
-                            c1 + I,
-                            c1 + 1 + I,
-                            c2,
-                            c2 - 1 + I,
-                            c2 - 1 + I,
-                            c11 + I,
-                            c21,
-                            c12 + 1,
-                            c22,
-                        ],
-                    ]
-                ).T
+                np.column_stack(
+                    (
+                        np.concatenate(
+                            (c1, c1, c1, c2 - 1, c2 - 1, c2, c11, c21 - I, c12, c22 - 1)
+                        ),
+                        np.concatenate(
+                            (
+                                c1 + 1,
+                                c1 + I,
+                                c1 + 1 + I,
+                                c2,
+                                c2 - 1 + I,
+                                c2 - 1 + I,
+                                c11 + I,
+                                c21,
+                                c12 + 1,
+                                c22,
+                            )
+                        ),
+                    )
+                )
                 + 1
             )
             # between slices
             edg1 = (
-                np.block(
-                    [
-                        [c1, c1, c1, c11, c11, c12, c12],
-                        [
-                            c1 + IJ,
-                            c1 + 1 + IJ,
-                            c1 + I + IJ,
-                            c11 + IJ,
-                            c11 + I + IJ,
-                            c12 + IJ,
-                            c12 + 1 + IJ,
-                        ],
-                    ]
-                ).T
+                np.column_stack(
+                    (
+                        np.concatenate((c1, c1, c1, c11, c11, c12, c12)),
+                        np.concatenate(
+                            (
+                                c1 + IJ,
+                                c1 + 1 + IJ,
+                                c1 + I + IJ,
+                                c11 + IJ,
+                                c11 + I + IJ,
+                                c12 + IJ,
+                                c12 + 1 + IJ,
+                            )
+                        ),
+                    )
+                )
                 + 1
             )
 
             edg2 = (
-                np.block(
-                    [
-                        [c2 - 1, c2, c2 - 1 + I, c21 - I, c21, c22 - 1, c22],
-                        [
-                            c2 - 1 + IJ,
-                            c2 - 1 + IJ,
-                            c2 - 1 + IJ,
-                            c21 - I + IJ,
-                            c21 - I + IJ,
-                            c22 - 1 + IJ,
-                            c22 - 1 + IJ,
-                        ],
-                    ]
-                ).T
+                np.column_stack(
+                    (
+                        np.concatenate(
+                            (c2 - 1, c2, c2 - 1 + I, c21 - I, c21, c22 - 1, c22)
+                        ),
+                        np.concatenate(
+                            (
+                                c2 - 1 + IJ,
+                                c2 - 1 + IJ,
+                                c2 - 1 + IJ,
+                                c21 - I + IJ,
+                                c21 - I + IJ,
+                                c22 - 1 + IJ,
+                                c22 - 1 + IJ,
+                            )
+                        ),
+                    )
+                )
                 + 1
             )
 
+            # Assign all slabs of this parity at once.
             if f:
-                for k in colon(2, K - 1, 2):
-                    edg[(k - 1) * n1 + np.arange(0, n1), :] = (
-                        np.block([[edg0], [edg2], [edg1], [IJ, 2 * IJ]]) + (k - 1) * IJ
-                    )
-
+                slab = np.vstack((edg0, edg2, edg1, [IJ, 2 * IJ]))
             else:
-                for k in colon(1, K - 1, 2):
-                    edg[(k - 1) * n1 + np.arange(0, n1), :] = (
-                        np.block([[edg0], [edg1], [edg2], [IJ, 2 * IJ]]) + (k - 1) * IJ
-                    )
+                slab = np.vstack((edg0, edg1, edg2, [IJ, 2 * IJ]))
+            k = np.arange(1 + f, K, 2)
+            rows = (k[:, None] - 1) * n1 + np.arange(0, n1)
+            edg[rows.ravel(), :] = (
+                slab[None, :, :] + (k[:, None, None] - 1) * IJ
+            ).reshape(-1, 2)
 
             if np.remainder((K + 1), 2) == f:
                 # top slice
@@ -160,24 +170,11 @@ def mesh_edges(surf, mask=None):
                 )
 
         # index by voxels in the "lat"
-        vid = np.array(
-            np.multiply(
-                np.cumsum(surf["lat"][:].T.flatten()), surf["lat"][:].T.flatten()
-            ),
-            dtype="int",
-        )
+        vid = np.array(np.multiply(np.cumsum(lat_flat), lat_flat), dtype="int")
         vid = vid.reshape(len(vid), 1)
 
         # only inside the lat
-        all_idx = np.all(
-            np.block(
-                [
-                    [surf["lat"].T.flatten()[edg[:, 0] - 1]],
-                    [surf["lat"].T.flatten()[edg[:, 1] - 1]],
-                ]
-            ).T,
-            axis=1,
-        )
+        all_idx = np.all(lat_flat[edg - 1], axis=1)
 
         edg = vid[edg[all_idx, :] - 1].reshape(np.shape(edg[all_idx, :] - 1))
         edg = edg - 1
@@ -192,12 +189,8 @@ def mesh_edges(surf, mask=None):
 
 
 def _mask_edges(edges, mask):
-    # TODO: this section is sloppily written.
-    missing_edges = np.where(~mask)
-    remove_edges = np.zeros(edges.shape, dtype=bool)
-    for i in range(edges.shape[0]):
-        for j in range(edges.shape[1]):
-            remove_edges[i, j] = (edges[i, j] == missing_edges).any()
+    missing_vertices = np.flatnonzero(~mask)
+    remove_edges = np.isin(edges, missing_vertices)
     idx = ~np.any(remove_edges, axis=1)
     edges = edges[idx, :]
     edges = _make_contiguous(edges)
@@ -221,30 +214,31 @@ def mesh_average(filenames, fun=np.add, output_surfstat=False):
         surface [BSPolyData, dict]: The output surface.
     """
 
-    if filenames.ndim is not 2:
+    if filenames.ndim != 2:
         raise ValueError("Filenames must be a 2-dimensional array.")
 
     for i in range(0, filenames.shape[0]):
-        surfaces = np.empty(filenames.shape[1], dtype=np.object)
+        # Concatenate second dimension of filenames.
+        tri_list = []
+        coord_list = []
+        n_points = 0
         for j in range(0, filenames.shape[1]):
 
             # Check whether input is BSPolyData or a filename.
             if isinstance(filenames[i, j], BSPolyData):
-                surfaces[j] = filenames[i, j]
+                surf = filenames[i, j]
             else:
-                surfaces[j] = read_surface(filenames[i, j])
+                surf = read_surface(filenames[i, j])
 
-            # Concatenate second dimension of filenames.
-            if j is 0:
-                tri = get_cells(surfaces[j])
-                coord = get_points(surfaces[j])
-            else:
-                tri = np.concatenate(
-                    (tri, get_cells(surfaces[j]) + coord.shape[0]), axis=0
-                )
-                coord = np.concatenate((coord, get_points(surfaces[j])), axis=0)
+            points = get_points(surf)
+            tri_list.append(get_cells(surf) + n_points)
+            coord_list.append(points)
+            n_points += points.shape[0]
+
+        tri = np.concatenate(tri_list, axis=0)
+        coord = np.concatenate(coord_list, axis=0)
 
-        if i is 0:
+        if i == 0:
             m = 1
             coord_all = coord
         else:
@@ -274,7 +268,5 @@ def _make_contiguous(Y):
     numpy.array
         Array Y converted to contiguous numbers in range(np.unique(Y).size).
     """
-    val = np.unique(Y)
-    for i in range(val.size):
-        Y[Y == val[i]] = i
-    return Y
+    _, Y_contiguous = np.unique(Y, return_inverse=True)
+    return Y_contiguous.reshape(Y.shape).astype(Y.dtype, copy=False)
@@ -1,6 +1,7 @@
 import warnings
 import numpy as np
 import numpy.linalg as la
+from scipy.linalg import qr, solve_triangular
 from brainstat.mesh.utils import mesh_edges
 from brainstat.stats.terms import Term, Random
 from brainstat.stats.utils import ismember
@@ -105,8 +106,10 @@ def _model_univariate_fixed_effects(self, Y):
     numpy.array
         Sum of squared errors.
     """
+    full_rank = _has_full_rank(self)
+
     if self.V is None:  # OLS
-        coef = la.pinv(self.X) @ Y
+        coef = _least_squares(self.X, Y, full_rank)
         residuals = Y - self.X @ coef
         V = None
 
@@ -114,8 +117,10 @@ def _model_univariate_fixed_effects(self, Y):
         V = self.V / np.diag(self.V).mean(0)
         Vmh = la.inv(la.cholesky(V).T)
 
-        coef = (la.pinv(Vmh @ self.X) @ Vmh) @ Y
-        residuals = Vmh @ Y - (Vmh @ self.X) @ coef
+        VmhX = Vmh @ self.X
+        VmhY = Vmh @ Y
+        coef = _least_squares(VmhX, VmhY, full_rank)
+        residuals = VmhY - VmhX @ coef
 
     SSE = np.sum(residuals ** 2, axis=0)
     SSE = SSE[None]
@@ -266,33 +271,65 @@ def _model_multivariate_fixed_effects(self, Y):
         Sum of squared errors.
     """
     k = Y.shape[2]
-    n_vertices = Y.shape[1]
 
     if self.V is None:
         X2 = self.X
         V = self.V
-        pinvX = la.pinv(self.X)
     else:
         V = self.V / np.diag(self.V).mean(0)
         Vmh = la.inv(la.cholesky(V)).T
         X2 = Vmh @ self.X
-        pinvX = la.pinv(X2)
-        Y = Vmh @ Y
-
-    coef = pinvX @ Y.T.swapaxes(-1, -2)
-    residuals = Y - (X2 @ coef).swapaxes(-1, -2).T
-    coef = coef.swapaxes(-1, -2).T
-
-    k2 = k * (k + 1) // 2
-    SSE = np.zeros((k2, n_vertices))
-    j = -1
-    for j1 in range(k):
-        for j2 in range(j1 + 1):
-            j = j + 1
-            SSE[j] = (residuals[..., j1] * residuals[..., j2]).sum(0)
+        Y = np.tensordot(Vmh, Y, axes=(1, 0))
+
+    coef = _least_squares(X2, Y, _has_full_rank(self))
+    residuals = Y - np.tensordot(X2, coef, axes=(1, 0))
+
+    il, jl = np.tril_indices(k)
+    SSE = np.einsum("nvi,nvj->ijv", residuals, residuals, optimize="optimal")
+    SSE = SSE[il, jl]
     return residuals, V, coef, SSE
 
 
+def _least_squares(X, Y, full_rank):
+    """Solves the least squares problem X @ coef = Y.
+
+    Parameters
+    ----------
+    X : numpy.array
+        Design matrix of shape (samples, predictors).
+    Y : numpy.array
+        Response variable matrix with samples along the first axis.
+    full_rank : bool
+        If True, X has full column rank and the solution is computed with a QR
+        decomposition. Otherwise, the minimum norm solution is computed with
+        the pseudoinverse.
+
+    Returns
+    -------
+    numpy.array
+        Model coefficients with predictors along the first axis.
+    """
+    if full_rank:
+        # scipy factorizes small integer and bool types in single precision.
+        Q, R = qr(np.asarray(X, dtype=float), mode="economic")
+        QtY = np.tensordot(Q.T, Y, axes=(1, 0))
+        coef = solve_triangular(R, QtY.reshape(R.shape[0], -1))
+        return coef.reshape(QtY.shape)
+    else:
+        return np.tensordot(la.pinv(X), Y, axes=(1, 0))
+
+
+def _has_full_rank(self):
+    """Checks whether the design matrix has full column rank.
+
+    Returns
+    -------
+    bool
+        True if the rank of the design matrix equals its number of columns.
+    """
+    return self.X.shape[0] - self.df == self.X.shape[1]
+
+
 def _get_design_matrix(self, n_samples):
     """Wrapper for fetching the design matrix
 
@@ -381,7 +418,9 @@ def _set_fixed_design(self, n_samples):
         X = self.model
 
     if X.shape[0] == 1:
-        X = np.tile(X, (n_samples, 1))
+        # Read-only view; the design matrix is never modified in place.
+        X = np.atleast_2d(X)
+        X = np.broadcast_to(X, (n_samples, X.shape[1]))
     return X
 
 
@@ -412,16 +451,24 @@ def _compute_resls(self, Y):
 
     edges = mesh_edges(self.surf, self.mask)
 
-    n_edges = edges.shape[0]
-
     Y = np.atleast_3d(Y)
-    resl = np.zeros((n_edges, Y.shape[2]))
-
+    resl = np.zeros((edges.shape[0], Y.shape[2]))
+
+    # Contiguous 1D gathers with preallocated buffers are faster than
+    # gathering (v, k) rows.
+    edges_0 = np.ascontiguousarray(edges[:, 0])
+    edges_1 = np.ascontiguousarray(edges[:, 1])
+    resl_j = np.empty(edges.shape[0])
+    diff = np.empty(edges.shape[0])
     for j in range(Y.shape[2]):
         normr = np.sqrt(self.SSE[((j + 1) * (j + 2) // 2) - 1])
+        resl_j[:] = 0
         for i in range(Y.shape[0]):
             u = Y[i, :, j] / normr
-            resl[:, j] += np.diff(u[edges], axis=1).ravel() ** 2
+            np.subtract(u[edges_1], u[edges_0], out=diff)
+            diff *= diff
+            resl_j += diff
+        resl[:, j] = resl_j
 
     return resl, mesh_connections
 
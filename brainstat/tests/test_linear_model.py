@@ -293,3 +293,15 @@ def test_16():
     oslm = pickle.load(ofile)
     ofile.close()
     dummy_test(idic, oslm)
+
+
+def test_least_squares_integer_design():
+    # QR solve of an integer design must match the float64 pseudoinverse.
+    from brainstat.stats._linear_model import _least_squares
+
+    rng = np.random.default_rng(0)
+    X = rng.integers(0, 100, size=(20, 9)).astype(np.uint16)
+    X[:, 0] = 1
+    Y = rng.standard_normal((20, 500))
+    expected = np.linalg.pinv(X.astype(float)) @ Y
+    assert np.allclose(_least_squares(X, Y, True), expected, rtol=1e-10)
@@ -0,0 +1,96 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import nibabel as nib
+import numpy as np
+import pytest
+from brainspace.mesh.mesh_creation import build_polydata
+from brainspace.mesh.mesh_elements import get_cells, get_points
+import brainstat.context.utils
+from brainstat.context.utils import mutli_surface_to_volume
+
+
+def test_mismatched_list_input():
+    # Input validation happens before any file is read.
+    with pytest.raises(ValueError):
+        mutli_surface_to_volume(
+            ["lh.pial", "rh.pial"], "lh.white", "template.nii", "lh.csv", "out.nii"
+        )
+
+
+def test_mismatched_number_of_surfaces():
+    with pytest.raises(ValueError):
+        mutli_surface_to_volume(
+            ["lh.pial", "rh.pial"],
+            ["lh.white"],
+            "template.nii",
+            ["lh.csv", "rh.csv"],
+            "out.nii",
+        )
+
+    with pytest.raises(ValueError):
+        mutli_surface_to_volume(
+            ["lh.pial", "rh.pial"],
+            ["lh.white", "rh.white"],
+            "template.nii",
+            ["lh.csv"],
+            "out.nii",
+        )
+
+
+def _fake_surface_to_volume(
+    pial, white, labels, volume_template, volume_save, interpolation, verbose
+):
+    # Writes a summary of the received meshes and labels to the volume.
+    data = np.zeros(volume_template.shape)
+    summary = np.concatenate(
+        (
+            np.ravel(get_points(pial)),
+            np.ravel(get_cells(pial)),
+            np.ravel(get_points(white)),
+            np.ravel(get_cells(white)),
+            labels,
+        )
+    )
+    data.flat[: summary.size] = summary
+    nib.save(nib.Nifti1Image(data, volume_template.affine), volume_save)
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="Requires the fork start method to patch the worker processes.",
+)
+def test_parallel_matches_serial(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        brainstat.context.utils, "surface_to_volume", _fake_surface_to_volume
+    )
+    # Fork so that workers inherit the patch; arguments are still pickled.
+    monkeypatch.setattr(
+        brainstat.context.utils,
+        "ProcessPoolExecutor",
+        partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("fork")),
+    )
+
+    points = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=float)
+    cells = np.array([[0, 1, 2], [0, 1, 3], [0, 2, 3], [1, 2, 3]])
+    pial = [build_polydata(points * 2, cells), build_polydata(points * 3, cells)]
+    white = [build_polydata(points, cells), build_polydata(points + 1, cells)]
+    labels = [np.arange(1, 5), np.arange(5, 9)]
+    template = nib.Nifti1Image(np.zeros((10, 10, 10)), np.eye(4))
+
+    outputs = []
+    for n_jobs in (1, 2):
+        output_file = str(tmp_path / "out_{}.nii.gz".format(n_jobs))
+        mutli_surface_to_volume(
+            list(pial),
+            list(white),
+            template,
+            list(labels),
+            output_file,
+            verbose=False,
+            n_jobs=n_jobs,
+        )
+        outputs.append(nib.load(output_file).get_fdata())
+
+    assert np.any(outputs[0])
+    assert np.array_equal(outputs[0], outputs[1])
@@ -38,7 +38,7 @@ def dummy_test(infile, expfile):
                 )
                 testout.append(comp)
         else:
-            if len(expected) is not 0:
+            if len(expected) != 0:
                 comp = np.allclose(empirical, expected, rtol=1e-05, equal_nan=True)
                 testout.append(comp)
 